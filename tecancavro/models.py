@@ -50,6 +50,8 @@ class XCaliburD(Syringe):
                                   layer (see transport.py)
                 *Must have a `.sendRcv(cmd)` instance method to send a command
                     string and parse the reponse (see transport.py)
+                *May have a `.fastStatusPoll()` instance method returning the
+                    status byte (or None) for faster ready polling
         Kwargs:
             `num_ports` (int) : number of ports on the distribution valve
                 [default] - 9
@@ -101,7 +101,13 @@ class Syringe(object):
         if self._ready:
             return True
         try:
-            ready = self._sendRcv('Q')[1]
+            # Use the transport's fixed-layout status poll when it has one
+            fast_poll = getattr(self.com_link, 'fastStatusPoll', None)
+            status = fast_poll() if fast_poll else None
+            if status is not None:
+                ready = self._checkStatus('{:08b}'.format(status))[0]
+            else:
+                ready = self._sendRcv('Q')[1]
             return ready
         except SyringeError as e:
             if self._repeat_error:
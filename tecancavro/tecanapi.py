@@ -53,7 +53,7 @@ class TecanAPI(object):
             # Get basic indices
             raw_frame = bytearray(raw_frame)
             frame_list = [byte for byte in raw_frame]
-            frame = frame_list[
+            frame = raw_frame[
                 frame_list.index(self.START_BYTE):
                 frame_list.index(self.STOP_BYTE)+2]
             if len(frame) < 5:
@@ -64,7 +64,7 @@ class TecanAPI(object):
         except ValueError:
             return False
         # Integrity checks
-        if not self._verifyChecksum(frame_list):
+        if not self._verifyChecksum(frame):
             return False
         # Dump payload
         if data_len != 0:
@@ -84,26 +84,37 @@ class TecanAPI(object):
             seq_byte = int(b'00111' + self.SEQ_NUM, 2)
         else:
             seq_byte = int(b'00110' + next(self.rotateSeqNum()), 2)
-        frame_list = [self.START_BYTE, self.addr, seq_byte] + \
-                      self._assembleCmd() + [self.STOP_BYTE]
-        checksum = self._buildChecksum(frame_list)
-        frame_list.append(checksum)
-        return bytearray(frame_list)
+        # Fill a preallocated frame in place:
+        # STX, addr, seq, <cmd>, ETX, checksum
+        cmd = self._assembleCmd()
+        etx_idx = len(cmd) + 3
+        frame = bytearray(etx_idx + 2)
+        frame[0] = self.START_BYTE
+        frame[1] = self.addr
+        frame[2] = seq_byte
+        frame[3:etx_idx] = cmd
+        frame[etx_idx] = self.STOP_BYTE
+        frame[etx_idx + 1] = self._buildChecksum(
+            memoryview(frame)[:etx_idx + 1])
+        return frame
 
     def _assembleCmd(self):
         """
-        Validates the current cmd payload and returns a list of bytes
-        generated from the command
+        Validates the current cmd payload and returns the bytes generated
+        from the command
         """
+        if isinstance(self._cmd, str):
+            return self._cmd.encode()
+        elif isinstance(self._cmd, (bytes, bytearray)):
+            return self._cmd
+        elif isinstance(self._cmd, int):
+            return bytes([self._cmd])
         try:
-            pack = [int(ord(c)) for c in self._cmd]
-            return pack
-        except:
-            if isinstance(self._cmd, int):
-                return [self._cmd]
-            else:
-                raise TypeError('TecanAPI: command {0} is neither iterable '
-                                'nor an int'.format(self._cmd))
+            # Any other iterable of characters, e.g. ['Q']
+            return bytes([ord(c) for c in self._cmd])
+        except TypeError:
+            raise TypeError('TecanAPI: command {0} is neither iterable '
+                            'nor an int'.format(self._cmd))
 
     def _buildChecksum(self, partial_frame):
         """
@@ -112,7 +123,7 @@ class TecanAPI(object):
         an int.
 
         Args:
-            `partial_frame` (list or bytestring) : an assembled api frame
+            `partial_frame` (bytes-like) : an assembled api frame
                 (with start and end bytes but no checksum)
         """
         checksum = 0
@@ -125,10 +136,10 @@ class TecanAPI(object):
         Verifies a Tecan OEM API checksum (XORed bytes, excluding checksum).
 
         Args:
-            `frame` (list or bytestring) : an assembled or received api frame,
+            `frame` (bytes-like) : an assembled or received api frame,
                 including the checksum
         """
-        partial_frame = frame[:-1]
+        partial_frame = memoryview(frame)[:-1]
         checksum = frame[-1]
         if checksum == self._buildChecksum(partial_frame):
             return True
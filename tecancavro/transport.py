@@ -11,23 +11,47 @@ which sends a command string (`cmd`) and returns a dictionary containing the
                   on the same RS-232 port (i.e., daisy-chaining) by sharing
                   a single serial port instance.
 
+`TecanAPIMicro` : Same as `TecanAPISerial`, but runs on microcontrollers
+                  (e.g. the Pi Pico) using the `machine.UART` driver.
+
+Both share port registration, retries and reply parsing through
+`_TecanAPITransportBase`.
+
 """
 
+import io
 import sys
-from random import getrandbits # used as alternative to uuid
+from collections import OrderedDict
 
 if sys.platform.startswith('win'):
     import serial
-    import uuid
+    from serial.tools import list_ports
     from time import sleep
 
 if sys.platform.startswith('rp2'):
         # Pi pico or similar
         from machine import UART, Pin
         from time import sleep
+        # (uart number, tx pin, rx pin) per port name; pin numbers are
+        # logical GPnn, not physical pins 1..40
+        _UART_PINS = {
+            'uart0': (0, Pin(0), Pin(1)),
+            'uart1': (1, Pin(4), Pin(5)),
+        }
          
 from tecancavro.tecanapi import TecanAPI, TecanAPITimeout
 
+_TIMEOUT_MSG = 'Tecan serial communication exceeded max attempts'
+
+# On MicroPython `sendRcv` raises one preallocated instance so that repeated
+# timeouts (e.g. while pumps warm up) do not allocate on the small heap.
+# CPython gets a fresh exception per timeout: a shared instance would carry
+# stale `__context__` and traceback frames between raises.
+if sys.implementation.name == 'micropython':
+    _TIMEOUT_EXC = TecanAPITimeout(_TIMEOUT_MSG)
+else:
+    _TIMEOUT_EXC = None
+
 # From http://stackoverflow.com/questions/12090503/
 #      listing-available-com-ports-with-python
 def listSerialPorts():
@@ -39,51 +63,48 @@ def listSerialPorts():
         A list of available serial ports
     """
     if sys.platform.startswith('win'):
-        ports = ['COM' + str(i + 1) for i in range(256)] 
+        # Enumerate from the OS device list rather than trying to open
+        # COM1..COM256, which can stall on unresponsive USB-serial drivers
+        result = [p.device for p in list_ports.comports()]
+        for port in result:
+            print(f'Found port: {port}')
+        return result
 
     elif sys.platform.startswith('rp2'):
         # Pi pico or similar
-        ports = ['uart0'] # could also include uart1 if needed
+        return ['uart0'] # could also include uart1 if needed
 
     else:
         raise EnvironmentError('Unsupported platform')
 
-    result = []
-
-    if sys.platform.startswith('rp2'):
-        for port in ports:
-            result.append(port)
-
-    else:
-        for port in ports:
-            try:
-                # print(f'checking port {port}')
-                s = serial.Serial(port)
-                s.close()
-                print(f'Found active port: {port}')
-                result.append(port)
-            except (OSError, serial.SerialException):
-                # print('got OSError in listSerialPorts')
-                pass
-    return result
-
-class TecanAPIMicro(TecanAPI):
+class _TecanAPITransportBase(TecanAPI):
     """
-    Wraps the TecanAPI class to provide serial communication encapsulation
-    and management for the Tecan OEM API. Designed to run on microcontrollers
-    like the Pi Pico (RP2040). Maps devices to a state-monitored
-    dictionary, `ser_mapping`, which allows multiple Tecan devices to
-    share a serial port (provided that the serial params are the same).
+    Common serial transport logic for the Tecan OEM API. Maps devices to a
+    state-monitored dictionary, `ser_mapping`, which allows multiple Tecan
+    devices to share a serial port (provided that the serial params are the
+    same).
+
+    Subclasses must define a `ser_mapping` dict of their own and the
+    following platform specific hooks:
+
+    `_openPort()` : opens `self.ser_port` with `self.ser_info` and returns
+                    the port object
+    `_closePort(ser)` : closes a port object returned by `_openPort`
+    `_flushInput()` : discards any bytes waiting in the receive buffer
+    `_portConflict()` : returns the exception raised when the port is
+                        already registered with different parameters
+    `_receiveFrame(read)` : reads one reply using the port's bound `read`
+                            method and returns `_parseReply`'s result
     """
 
-    ser_mapping = {}
+    FRAME_CACHE_SIZE = 32
+    _next_id = 0  # source of unique device ids for port registration
 
     @classmethod
-    def findSerialPumps(cls, tecan_addrs=[0], ser_baud=9600, ser_timeout=500,
-                        max_attempts=2):
-        ''' Find any enumerated syringe pumps on the serial ports.
-
-        timeout in ms.
+    def findSerialPumps(cls, tecan_addrs, ser_baud, ser_timeout,
+                        max_attempts):
+        ''' Find any enumerated syringe pumps on the serial ports. Subclasses
+        wrap this to supply their default arguments.
 
         Returns list of (<ser_port>, <pump_config>, <pump_firmware_version>)
         tuples.
@@ -91,133 +112,247 @@ class TecanAPIMicro(TecanAPI):
         print('Starting findSerialPumps...')
         found_devices = []
         for port_path in listSerialPorts():
-            print(f'Checking port {port_path}')
+            found_devices.extend(cls._probePort(port_path, tecan_addrs,
+                                 ser_baud, ser_timeout, max_attempts))
+        # print(f'devices found = {found_devices}')
+        return found_devices
+
+    @classmethod
+    def _probePort(cls, port_path, tecan_addrs, ser_baud, ser_timeout,
+                   max_attempts):
+        """
+        Probes each address in `tecan_addrs` on a single serial port. The
+        port is opened once and the same instance is re-addressed for
+        each probe, rather than re-registering the port per address.
+
+        Returns a list of (<ser_port>, <pump_config>,
+        <pump_firmware_version>) tuples.
+        """
+        print(f'Checking port {port_path}')
+        found_devices = []
+        if not tecan_addrs:
+            return found_devices
+        try:
+            # print(f'try block: attempting to open port...')
+            p = cls(tecan_addrs[0], port_path, ser_baud,
+                    ser_timeout, max_attempts)
+        except OSError as e:
+            if not cls._portUnavailable(e):
+                raise
+            return found_devices
+        with p:
             for addr in tecan_addrs:
                 print(f'Checking address {addr}...')
-               
-                try:
-                    # print(f'try block: attempting to open port...')
-                    p = cls(addr, port_path, ser_baud,
-                            ser_timeout, max_attempts)
-                    # print('Attempting to read pump configuration...')
-                    config = p.sendRcv('?76')['data']
-                    # print(f'pump configuration: {config}')
-                    fw_version = p.sendRcv('&')['data']
-                    found_devices.append((port_path, config, fw_version))
-                except OSError as e:
-                    if e.errno != 16:  # Resource busy
-                        raise
-                except TecanAPITimeout as err:
-                    # print(err)
-                    pass
-        # print(f'devices found = {found_devices}')
+                p._setAddr(addr)
+                # print('Attempting to read pump configuration...')
+                config = p._trySendRcv('?76')
+                if config is None:
+                    continue
+                # print(f'pump configuration: {config}')
+                fw_version = p._trySendRcv('&')
+                if fw_version is None:
+                    continue
+                found_devices.append((port_path, config['data'],
+                                      fw_version['data']))
         return found_devices
 
-    def __init__(self, tecan_addr, ser_port, ser_baud, ser_timeout=500,
-                 max_attempts=2):
+    @classmethod
+    def _portUnavailable(cls, err):
+        """
+        Returns True if `err`, raised while opening a port during discovery,
+        means the port should be skipped rather than the error re-raised.
+        """
+        return err.errno == 16  # Resource busy
 
-        super(TecanAPIMicro, self).__init__(tecan_addr)
+    def __init__(self, tecan_addr, ser_port, ser_baud, ser_timeout,
+                 max_attempts):
 
-        self.id_ = getrandbits(32) # poor mans uuid
-        # self.id_ = str(getrandbits(32)) # poor mans uuid
+        super(_TecanAPITransportBase, self).__init__(tecan_addr)
+
+        self.id_ = _TecanAPITransportBase._next_id
+        _TecanAPITransportBase._next_id += 1
         self.ser_port = ser_port
-        self.ser_info = {
-            'baud': ser_baud,
-            'timeout': ser_timeout,
-            'max_attempts': max_attempts
-        }
+        # (baud, timeout, max_attempts)
+        self.ser_info = (ser_baud, ser_timeout, max_attempts)
+        # OrderedDict: MicroPython's plain dict does not keep insertion order
+        self._frame_cache = OrderedDict()
         self._registerSer()
 
     def sendRcv(self, cmd):
+        frame_in = self._trySendRcv(cmd)
+        if frame_in is None:
+            raise _TIMEOUT_EXC or TecanAPITimeout(_TIMEOUT_MSG)
+        return frame_in
+
+    def _trySendRcv(self, cmd):
+        """
+        Same as `sendRcv`, but returns None instead of raising
+        `TecanAPITimeout` once the retry attempts are exhausted.
+        """
         # print("starting sendRcv...")
+        # Bind the port methods once rather than looking them up through
+        # `self._ser` on every attempt
+        write = self._ser.write
+        read = self._ser.read
+        receive = self._receiveFrame
+        max_attempts = self.ser_info[2]
         attempt_num = 0
-        while attempt_num < self.ser_info['max_attempts']:
+        while attempt_num < max_attempts:
+            attempt_num += 1
+            # print(f'Communication attempt num {attempt_num}')
+            if attempt_num == 1:
+                frame_out = self._emitCachedFrame(cmd)
+            else:
+                frame_out = self.emitRepeat()
             try:
-                attempt_num += 1
-                # print(f'Communication attempt num {attempt_num}')
-                if attempt_num == 1:
-                    frame_out = self.emitFrame(cmd)
-                else:
-                    frame_out = self.emitRepeat()
-                # print(self)
-                self._sendFrame(frame_out)
-                sleep(0.1)
-                frame_in = self._receiveFrame()
-                if frame_in:
-                    return frame_in
-                sleep(0.05 * attempt_num)
-            # except serial.SerialException:
-            except:
-                sleep(0.2)
-        # raise(TecanAPITimeout('Tecan serial communication exceeded max '
-        #                       'attempts [{0}]'.format(
-        #                       self.ser_info['max_attempts'])))
-        raise(TecanAPITimeout('Tecan timeout error'))
-
-    def _sendFrame(self, frame):
-        # print(f'frame to be sent: {frame.hex(" ")}')
-        self._ser.write(frame)
-
-    def _receiveFrame(self):
-        raw_data = self._ser.read(50)
-        # print(f'raw_data return from _receiveFrame: {raw_data}')
-        return self.parseFrame(raw_data)
+                # print(f'frame to be sent: {frame_out.hex(" ")}')
+                write(frame_out)
+                frame_in = receive(read)
+            except OSError:
+                # Port error: retry straight away, only back off on an
+                # empty or invalid reply
+                continue
+            if frame_in:
+                return frame_in
+            sleep(0.05 * attempt_num)
+        return None
+
+    def _setAddr(self, tecan_addr):
+        """
+        Points this instance at a different device address on the same
+        port. Cached frames embed the address, so they are discarded.
+        """
+        self.addr = tecan_addr + 0x31
+        self._frame_cache.clear()
+
+    def fastStatusPoll(self):
+        """
+        Specialized status query used while polling for ready. Sends the
+        (cached) `Q` frame and reads the fixed-length reply
+        (STX, addr, status, ETX, checksum) directly, skipping the generic
+        `parseFrame` path.
+
+        Returns the status byte as an int, or None if no valid reply was
+        received or the port raised an error (callers should fall back to
+        `sendRcv`, which retries).
+        """
+        try:
+            self._ser.write(self._emitCachedFrame('Q'))
+            raw = self._ser.read(5)
+            if (raw and len(raw) == 5 and raw[0] == self.START_BYTE and
+                    raw[3] == self.STOP_BYTE and
+                    raw[4] == self._buildChecksum(memoryview(raw)[:4])):
+                return raw[2]
+            # Drop whatever is left of a short or misaligned reply so the
+            # next poll starts on a frame boundary
+            self._flushInput()
+        except OSError:
+            pass
+        return None
+
+    def _emitCachedFrame(self, cmd):
+        """
+        Returns the outgoing frame for `cmd`, reusing a previously built
+        frame when the same command has been sent before (e.g. status
+        polling). The `FRAME_CACHE_SIZE` most recently used frames are kept.
+        """
+        if not isinstance(cmd, (str, bytes, int)):
+            # e.g. a list of characters: unhashable, so build it every time
+            return self.emitFrame(cmd)
+        cache = self._frame_cache
+        # Pop and reinsert so insertion order tracks recency of use
+        frame = cache.pop(cmd, None)
+        if frame is None:
+            frame = bytes(self.emitFrame(cmd))
+            if len(cache) >= self.FRAME_CACHE_SIZE:
+                del cache[next(iter(cache))]  # least recently used
+        else:
+            self._cmd = cmd  # keep `emitRepeat` in step with the cached frame
+        cache[cmd] = frame
+        return frame
+
+    def _parseReply(self, raw_data):
+        # print(f'raw_data return from read: {raw_data}')
+        if not raw_data:
+            return False
+        # Well-formed replies take the fixed-layout path; anything else
+        # (leading noise, truncated frames) goes through `parseFrame`
+        return self._parseFixed(raw_data) or self.parseFrame(raw_data)
+
+    def _parseFixed(self, raw):
+        """
+        Parses a reply that is exactly one OEM frame
+        (STX, addr, status, <data>, ETX, checksum) by direct indexing.
+        Returns None if `raw` does not have that layout or fails the
+        checksum, otherwise the same payload dictionary as `parseFrame`.
+        """
+        if (len(raw) < 5 or raw[0] != self.START_BYTE or
+                raw[-2] != self.STOP_BYTE or
+                raw[-1] != self._buildChecksum(memoryview(raw)[:-1])):
+            return None
+        return {
+            'status_byte': '{:08b}'.format(raw[2]),
+            'data': bytes(raw[3:-2]) or None
+        }
 
     def _registerSer(self):
         """
-        Checks to see if another TecanAPISerial instance has registered the
-        same serial port in `ser_mapping`. If there is a conflict, checks to
-        see if the parameters match, and if they do, shares the connection.
-        Otherwise it raises a `serial.SerialException`.
+        Checks to see if another instance has registered the same serial
+        port in `ser_mapping`. If there is a conflict, checks to see if the
+        parameters match, and if they do, shares the connection. Otherwise
+        it raises the exception returned by `_portConflict`.
         """
-        reg = TecanAPIMicro.ser_mapping
+        reg = self.ser_mapping
         port = self.ser_port
         # print(f'In _registerSer. Port = {port}')
-        # print(f'reg = {reg}')
-        if self.ser_port not in reg:
-            # print(f'{self.ser_port} not in reg. Attemping to register port.')
-            reg[port] = {}
-            reg[port]['info'] = {k: v for k, v in self.ser_info.items()}
-            # print( 'registered port info:', reg[port]['info'])
-            uart = UART(int(port[-1]),9600) # last character of port name is port number
-            uart.init(
-                    baudrate=reg[port]['info']['baud'],
-                    timeout=reg[port]['info']['timeout'],
-                    tx=Pin(0),
-                    rx=Pin(1),
-                    flow = 0
-                    ) # note pin numbers are logical GPnn, not physical pins 1..40
-            reg[port]['_ser'] = uart
-            # print(f"registered serial port after init: {reg[port]['_ser']}")
-            reg[port]['_devices'] = [self.id_]
+        if port not in reg:
+            # print(f'{port} not in reg. Attemping to register port.')
+            # Open before touching `reg` so a failed open leaves no
+            # half-registered entry behind
+            ser = self._openPort()
+            reg[port] = {
+                'info': self.ser_info,
+                '_ser': ser,
+                '_devices': set([self.id_])
+            }
         else:
-            if len(set(self.ser_info.items()) & set(reg[port]['info'].items())) != 3:
-                raise Exception('TecanAPISerial conflict: ' \
-                    'another device is already registered to {0} with ' \
-                    'different parameters'.format(port))
+            if reg[port]['info'] != self.ser_info:
+                raise self._portConflict()
             else:
-                reg[port]['_devices'].append(self.id_)
+                reg[port]['_devices'].add(self.id_)
         self._ser = reg[port]['_ser']
 
-    def __del__(self):
+    def _portConflictMsg(self):
+        return ('{0} conflict: another device is already registered to {1} '
+                'with different parameters'.format(type(self).__name__,
+                                                   self.ser_port))
+
+    def close(self):
         """
-        Cleanup serial port registration on delete
+        Removes this device from the serial port registration, closing the
+        port once no other devices are using it. Safe to call repeatedly.
         """
-        port_reg = TecanAPISerial.ser_mapping[self.ser_port]
-        try:
-            dev_list = port_reg['_devices']
-            ind = dev_list.index(self.id_)
-            del dev_list[ind]
-            if len(dev_list) == 0:
-                port_reg['_ser'].deinit()
-                del port_reg, TecanAPISerial.ser_mapping[self.ser_port]
-        except KeyError:
-            pass
+        port_reg = self.ser_mapping.get(self.ser_port)
+        if port_reg is None:
+            return
+        dev_list = port_reg['_devices']
+        dev_list.discard(self.id_)
+        if len(dev_list) == 0:
+            self._closePort(port_reg['_ser'])
+            self.ser_mapping.pop(self.ser_port, None)
 
-class TecanAPISerial(TecanAPI):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TecanAPIMicro(_TecanAPITransportBase):
     """
     Wraps the TecanAPI class to provide serial communication encapsulation
-    and management for the Tecan OEM API. Maps devices to a state-monitored
+    and management for the Tecan OEM API. Designed to run on microcontrollers
+    like the Pi Pico (RP2040). Maps devices to a state-monitored
     dictionary, `ser_mapping`, which allows multiple Tecan devices to
     share a serial port (provided that the serial params are the same).
     """
@@ -225,118 +360,122 @@ class TecanAPISerial(TecanAPI):
     ser_mapping = {}
 
     @classmethod
-    def findSerialPumps(cls, tecan_addrs=[0], ser_baud=9600, ser_timeout=0.2,
+    def findSerialPumps(cls, tecan_addrs=[0], ser_baud=9600, ser_timeout=500,
                         max_attempts=2):
-        ''' Find any enumerated syringe pumps on the local com / serial ports.
+        ''' Find any enumerated syringe pumps on the serial ports.
+
+        timeout in ms.
 
         Returns list of (<ser_port>, <pump_config>, <pump_firmware_version>)
         tuples.
         '''
-        print('Starting findSerialPumps...')
-        found_devices = []
-        for port_path in listSerialPorts():
-            print(f'Checking port {port_path}')
-            for addr in tecan_addrs:
-                print(f'Checking address {addr}')
-               
-                try:
-                    p = cls(addr, port_path, ser_baud,
-                            ser_timeout, max_attempts)
-                    config = p.sendRcv('?76')['data']
-                    fw_version = p.sendRcv('&')['data']
-                    found_devices.append((port_path, config, fw_version))
-                except OSError as e:
-                    if e.errno != 16:  # Resource busy
-                        raise
-                except TecanAPITimeout:
-                    pass
-        # print(f'devices found = {found_devices}')
-        return found_devices
+        return super(TecanAPIMicro, cls).findSerialPumps(
+            tecan_addrs, ser_baud, ser_timeout, max_attempts)
 
-    def __init__(self, tecan_addr, ser_port, ser_baud, ser_timeout=0.1,
-                 max_attempts=5):
-
-        super(TecanAPISerial, self).__init__(tecan_addr)
+    def __init__(self, tecan_addr, ser_port, ser_baud, ser_timeout=500,
+                 max_attempts=2):
+        super(TecanAPIMicro, self).__init__(tecan_addr, ser_port, ser_baud,
+                                            ser_timeout, max_attempts)
+
+    def _receiveFrame(self, read):
+        return self._parseReply(read(50))
+
+    def _openPort(self):
+        baud, timeout, _ = self.ser_info
+        uart_num, tx, rx = _UART_PINS[self.ser_port]
+        uart = UART(uart_num, 9600)
+        # `timeout` bounds the wait for the first reply byte; once a
+        # reply starts, `timeout_char` (~10 character times, in ms) ends
+        # the read as soon as the line goes quiet.
+        uart.init(
+                baudrate=baud,
+                timeout=timeout,
+                timeout_char=100000 // baud + 1,
+                tx=tx,
+                rx=rx,
+                flow = 0
+                )
+        # print(f"registered serial port after init: {uart}")
+        return uart
+
+    def _closePort(self, uart):
+        uart.deinit()
+
+    def _flushInput(self):
+        pending = self._ser.any()
+        if pending:
+            self._ser.read(pending)
+
+    def _portConflict(self):
+        return Exception(self._portConflictMsg())
+
+
+class TecanAPISerial(_TecanAPITransportBase):
+    """
+    Wraps the TecanAPI class to provide serial communication encapsulation
+    and management for the Tecan OEM API. Maps devices to a state-monitored
+    dictionary, `ser_mapping`, which allows multiple Tecan devices to
+    share a serial port (provided that the serial params are the same).
+    """
 
-        self.id_ = str(uuid.uuid4())
-        self.ser_port = ser_port
-        self.ser_info = {
-            'baud': ser_baud,
-            'timeout': ser_timeout,
-            'max_attempts': max_attempts
-        }
-        self._registerSer()
+    ser_mapping = {}
 
-    def sendRcv(self, cmd):
-        attempt_num = 0
-        while attempt_num < self.ser_info['max_attempts']:
-            try:
-                attempt_num += 1
-                if attempt_num == 1:
-                    frame_out = self.emitFrame(cmd)
-                else:
-                    frame_out = self.emitRepeat()
-                self._sendFrame(frame_out)
-                frame_in = self._receiveFrame()
-                if frame_in:
-                    return frame_in
-                sleep(0.05 * attempt_num)
-            except serial.SerialException:
-                sleep(0.2)
-        raise(TecanAPITimeout('Tecan serial communication exceeded max '
-                              'attempts [{0}]'.format(
-                              self.ser_info['max_attempts'])))
-
-    def _sendFrame(self, frame):
-        # print(f'frame to be sent: {frame.hex(" ")}')
-        self._ser.write(frame)
-
-    def _receiveFrame(self):
-        raw_data = b''
-        raw_byte = self._ser.read()
-        while raw_byte != b'':
-            raw_data += raw_byte
-            raw_byte = self._ser.read()
-        return self.parseFrame(raw_data)
+    @classmethod
+    def findSerialPumps(cls, tecan_addrs=[0], ser_baud=9600, ser_timeout=0.2,
+                        max_attempts=2):
+        ''' Find any enumerated syringe pumps on the local com / serial ports.
 
-    def _registerSer(self):
-        """
-        Checks to see if another TecanAPISerial instance has registered the
-        same serial port in `ser_mapping`. If there is a conflict, checks to
-        see if the parameters match, and if they do, shares the connection.
-        Otherwise it raises a `serial.SerialException`.
-        """
-        reg = TecanAPISerial.ser_mapping
-        port = self.ser_port
-        if self.ser_port not in reg:
-            reg[port] = {}
-            reg[port]['info'] = {k: v for k, v in self.ser_info.items()}
-            reg[port]['_ser'] = serial.Serial(port=port,
-                                    baudrate=reg[port]['info']['baud'],
-                                    timeout=reg[port]['info']['timeout'])
-            reg[port]['_devices'] = [self.id_]
-        else:
-            if len(set(self.ser_info.items()) &
-               set(reg[port]['info'].items())) != 3:
-                raise serial.SerialException('TecanAPISerial conflict: ' \
-                    'another device is already registered to {0} with ' \
-                    'different parameters'.format(port))
-            else:
-                reg[port]['_devices'].append(self.id_)
-        self._ser = reg[port]['_ser']
+        Returns list of (<ser_port>, <pump_config>, <pump_firmware_version>)
+        tuples.
+        '''
+        return super(TecanAPISerial, cls).findSerialPumps(
+            tecan_addrs, ser_baud, ser_timeout, max_attempts)
 
-    def __del__(self):
-        """
-        Cleanup serial port registration on delete
-        """
-        port_reg = TecanAPISerial.ser_mapping[self.ser_port]
-        try:
-            dev_list = port_reg['_devices']
-            ind = dev_list.index(self.id_)
-            del dev_list[ind]
-            if len(dev_list) == 0:
-                port_reg['_ser'].close()
-                del port_reg, TecanAPISerial.ser_mapping[self.ser_port]
-        except KeyError:
-            pass
+    @classmethod
+    def _portUnavailable(cls, err):
+        # Enumerated but could not be opened (e.g. in use)
+        return (isinstance(err, serial.SerialException) or
+                super(TecanAPISerial, cls)._portUnavailable(err))
 
+    def __init__(self, tecan_addr, ser_port, ser_baud, ser_timeout=0.1,
+                 max_attempts=5):
+        super(TecanAPISerial, self).__init__(tecan_addr, ser_port, ser_baud,
+                                             ser_timeout, max_attempts)
+
+    def _receiveFrame(self, read):
+        read_until = getattr(self._ser, 'read_until', None)
+        if read_until is None:
+            # Drivers without `read_until` have to be polled byte by byte;
+            # BytesIO keeps the accumulation linear in the frame length
+            buf = io.BytesIO()
+            raw_byte = read()
+            while raw_byte:
+                buf.write(raw_byte)
+                raw_byte = read()
+            return self._parseReply(buf.getvalue())
+        # Read up to and including the ETX byte in one call, then pick up the
+        # trailing checksum byte, instead of polling one byte at a time.
+        raw_data = bytearray(read_until(b'\x03', 64))
+        if raw_data.endswith(b'\x03'):
+            # Only wait for the checksum if the frame was not cut short
+            raw_data.extend(read(1))
+        return self._parseReply(raw_data)
+
+    def _openPort(self):
+        baud, timeout, _ = self.ser_info
+        # Allow ~10 character times of line silence before giving up on
+        # the rest of a frame (10 bits per character incl. start/stop)
+        char_time = 10.0 / baud
+        return serial.Serial(port=self.ser_port,
+                             baudrate=baud,
+                             timeout=timeout,
+                             inter_byte_timeout=10 * char_time)
+
+    def _closePort(self, ser):
+        ser.close()
+
+    def _flushInput(self):
+        self._ser.reset_input_buffer()
+
+    def _portConflict(self):
+        return serial.SerialException(self._portConflictMsg())
@@ -52,4 +52,6 @@ if __name__ == '__main__':
     pump1.dispense(3,2000)
     delay = pump1.executeChain()
     pump1.waitReady(delay)
+    for _, pump in pumps:
+        pump.com_link.close()
     print("done")
\ No newline at end of file